@@ -72,6 +72,8 @@ class OSRSBucketAPI:
     def save_to_json(self, data: Any, filename: str, indent: int = 2):
         import os
         os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else '.', exist_ok=True)
-        with open(filename, 'w', encoding='utf-8') as f:
+        temp_filename = f"{filename}.tmp"
+        with open(temp_filename, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=indent, ensure_ascii=False)
+        os.replace(temp_filename, filename)
         print(f"Data saved to {filename}")
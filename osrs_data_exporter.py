@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import time
+from array import array
+from typing import List, Dict, Any, Optional, Tuple
+
+
+class OSRSArtifactExporter:
+    DATASETS = [
+        'osrs_npcs',
+        'osrs_equipment_flat',
+        'osrs_items',
+        'osrs_npc_drops',
+    ]
+
+    ARRAY_TYPECODES = {
+        'int64': 'q',
+        'float64': 'd',
+        'bool': 'b',
+    }
+
+    MANIFEST = 'manifest.json'
+    FORMAT_VERSION = 3
+
+    def __init__(self, data_dir: str = "data", compresslevel: int = 9):
+        self.data_dir = data_dir
+        self.compresslevel = compresslevel
+
+    @staticmethod
+    def value_kind(value: Any) -> str:
+        if isinstance(value, bool):
+            return 'bool'
+        if isinstance(value, int):
+            return 'int'
+        if isinstance(value, float):
+            return 'float'
+        if isinstance(value, str):
+            return 'str'
+        return 'json'
+
+    @classmethod
+    def column_type(cls, values: List[Any]) -> str:
+        counts = {'bool': 0, 'int': 0, 'float': 0, 'str': 0, 'json': 0}
+        for value in values:
+            counts[cls.value_kind(value)] += 1
+
+        numeric = counts['int'] + counts['float']
+        best = max(('bool', counts['bool']), ('numeric', numeric), ('str', counts['str']), ('json', counts['json']),
+                   key=lambda item: item[1])[0]
+
+        if best == 'numeric':
+            return 'float64' if counts['float'] else 'int64'
+        if best == 'bool':
+            return 'bool'
+        if best == 'str':
+            return 'string'
+        return 'json'
+
+    @staticmethod
+    def fits_column(column_type: str, value: Any) -> bool:
+        if column_type == 'int64':
+            return type(value) is int and -2 ** 63 <= value < 2 ** 63
+        if column_type == 'float64':
+            return type(value) is float or (type(value) is int and abs(value) <= 2 ** 53)
+        if column_type == 'bool':
+            return type(value) is bool
+        if column_type == 'string':
+            return type(value) is str
+        return True
+
+    def compress(self, payload: bytes) -> bytes:
+        return gzip.compress(payload, compresslevel=self.compresslevel, mtime=0)
+
+    @staticmethod
+    def write_atomic(filename: str, payload: bytes):
+        temp_filename = f"{filename}.tmp"
+        with open(temp_filename, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_filename, filename)
+
+    def encode_column(self, column_type: str, values: List[Any]) -> bytes:
+        if column_type in self.ARRAY_TYPECODES:
+            data = array(self.ARRAY_TYPECODES[column_type], values)
+            if sys.byteorder != 'little':
+                data.byteswap()
+            return data.tobytes()
+
+        if column_type == 'string':
+            encoded = [value.encode('utf-8') for value in values]
+            offsets = array('I', [0])
+            total = 0
+            for value in encoded:
+                total += len(value)
+                offsets.append(total)
+            if sys.byteorder != 'little':
+                offsets.byteswap()
+            return offsets.tobytes() + b''.join(encoded)
+
+        return json.dumps(values, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def load_records(self, name: str) -> Optional[List[Dict[str, Any]]]:
+        filename = os.path.join(self.data_dir, f"{name}.json")
+        if not os.path.exists(filename):
+            return None
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            print(f"Skipping {filename}: expected a list of records")
+            return None
+        return data
+
+    def save_ndjson_gz(self, records: List[Dict[str, Any]], filename: str):
+        buffer = io.BytesIO()
+        with gzip.GzipFile(filename='', mode='wb', fileobj=buffer, compresslevel=self.compresslevel, mtime=0) as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+                f.write(b'\n')
+        self.write_atomic(filename, buffer.getvalue())
+        print(f"Data saved to {filename}")
+
+    def save_columns(self, records: List[Dict[str, Any]], directory: str):
+        field_order = []
+        seen = set()
+        for record in records:
+            for key in record:
+                if key not in seen:
+                    seen.add(key)
+                    field_order.append(key)
+
+        files: Dict[str, bytes] = {}
+        manifest = {
+            'format_version': self.FORMAT_VERSION,
+            'rows': len(records),
+            'columns': [],
+        }
+
+        for position, field in enumerate(field_order):
+            present = [record[field] for record in records if field in record]
+            column_type = self.column_type(present)
+            filler = {'int64': 0, 'float64': 0.0, 'bool': False, 'string': '', 'json': None}[column_type]
+
+            values = []
+            missing = []
+            exceptions = {}
+            ints = []
+            for row, record in enumerate(records):
+                if field not in record:
+                    missing.append(row)
+                    values.append(filler)
+                    continue
+                value = record[field]
+                if self.fits_column(column_type, value):
+                    if column_type == 'float64' and type(value) is int:
+                        ints.append(row)
+                        value = float(value)
+                    values.append(value)
+                else:
+                    exceptions[str(row)] = value
+                    values.append(filler)
+
+            filename = f"{position:03d}.bin.gz"
+            files[filename] = self.compress(self.encode_column(column_type, values))
+
+            column = {'name': field, 'type': column_type, 'file': filename}
+            if missing or exceptions or ints:
+                column['extras'] = f"{position:03d}.extras.json.gz"
+                extras = json.dumps({'missing': missing, 'exceptions': exceptions, 'ints': ints},
+                                    separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+                files[column['extras']] = self.compress(extras)
+            manifest['columns'].append(column)
+
+        layouts = []
+        layout_ids = {}
+        row_layouts = []
+        for record in records:
+            keys = tuple(record)
+            if keys not in layout_ids:
+                layout_ids[keys] = len(layouts)
+                layouts.append(list(keys))
+            row_layouts.append(layout_ids[keys])
+        manifest['layouts'] = 'layouts.json.gz'
+        layouts_payload = json.dumps({'layouts': layouts, 'rows': row_layouts}, separators=(',', ':')).encode('utf-8')
+        files[manifest['layouts']] = self.compress(layouts_payload)
+
+        digest = hashlib.sha1()
+        for filename in sorted(files):
+            digest.update(filename.encode('utf-8'))
+            digest.update(files[filename])
+        manifest['version'] = digest.hexdigest()[:16]
+
+        os.makedirs(directory, exist_ok=True)
+        previous_version = self.read_manifest_version(directory)
+        version_directory = os.path.join(directory, manifest['version'])
+        if not os.path.isdir(version_directory):
+            temp_directory = f"{version_directory}.tmp"
+            shutil.rmtree(temp_directory, ignore_errors=True)
+            os.makedirs(temp_directory)
+            try:
+                for filename, payload in files.items():
+                    with open(os.path.join(temp_directory, filename), 'wb') as f:
+                        f.write(payload)
+                os.replace(temp_directory, version_directory)
+            except OSError:
+                shutil.rmtree(temp_directory, ignore_errors=True)
+                raise
+
+        if previous_version != manifest['version']:
+            manifest_payload = json.dumps(manifest, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+            self.write_atomic(os.path.join(directory, self.MANIFEST), manifest_payload)
+
+            keep = {self.MANIFEST, manifest['version'], previous_version}
+            for filename in os.listdir(directory):
+                if filename not in keep:
+                    path = os.path.join(directory, filename)
+                    if os.path.isdir(path):
+                        shutil.rmtree(path)
+                    else:
+                        os.remove(path)
+
+        print(f"Data saved to {directory}/ ({len(field_order)} columns)")
+
+    @classmethod
+    def read_manifest_version(cls, directory: str) -> Optional[str]:
+        try:
+            with open(os.path.join(directory, cls.MANIFEST), 'r', encoding='utf-8') as f:
+                return json.load(f).get('version')
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    @classmethod
+    def columns_size(cls, directory: str) -> int:
+        total = os.path.getsize(os.path.join(directory, cls.MANIFEST))
+        version_directory = os.path.join(directory, cls.read_manifest_version(directory))
+        for entry in os.scandir(version_directory):
+            total += entry.stat().st_size
+        return total
+
+    def export_dataset(self, name: str) -> Optional[Dict[str, int]]:
+        records = self.load_records(name)
+        if records is None:
+            return None
+
+        ndjson_filename = os.path.join(self.data_dir, f"{name}.ndjson.gz")
+        columns_directory = os.path.join(self.data_dir, f"{name}.columns")
+
+        self.save_ndjson_gz(records, ndjson_filename)
+        self.save_columns(records, columns_directory)
+
+        return {
+            'json': os.path.getsize(os.path.join(self.data_dir, f"{name}.json")),
+            'ndjson_gz': os.path.getsize(ndjson_filename),
+            'columns': self.columns_size(columns_directory),
+        }
+
+    def export_all(self, datasets: Optional[List[str]] = None) -> Dict[str, Dict[str, int]]:
+        summary = {}
+        for name in datasets or self.DATASETS:
+            sizes = self.export_dataset(name)
+            if sizes is None:
+                print(f"Skipping {name}: no data/{name}.json")
+                continue
+            summary[name] = sizes
+        return summary
+
+
+class OSRSColumnReader:
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, OSRSArtifactExporter.MANIFEST), 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format_version') != OSRSArtifactExporter.FORMAT_VERSION:
+            raise ValueError(f"Unsupported column format version: {self.manifest.get('format_version')}")
+        self.rows = self.manifest['rows']
+        self.version_directory = os.path.join(directory, self.manifest['version'])
+        self.columns = {column['name']: column for column in self.manifest['columns']}
+
+    @property
+    def column_names(self) -> List[str]:
+        return [column['name'] for column in self.manifest['columns']]
+
+    def read_raw(self, name: str) -> Tuple[Dict[str, Any], Any]:
+        if name not in self.columns:
+            raise KeyError(f"Unknown column: {name}")
+        column = self.columns[name]
+
+        with open(os.path.join(self.version_directory, column['file']), 'rb') as f:
+            payload = gzip.decompress(f.read())
+
+        column_type = column['type']
+        if column_type in OSRSArtifactExporter.ARRAY_TYPECODES:
+            data = array(OSRSArtifactExporter.ARRAY_TYPECODES[column_type])
+            data.frombytes(payload)
+            if sys.byteorder != 'little':
+                data.byteswap()
+            if column_type == 'bool':
+                data = [bool(value) for value in data]
+            return column, data
+
+        if column_type == 'string':
+            offsets = array('I')
+            offsets.frombytes(payload[:(self.rows + 1) * offsets.itemsize])
+            if sys.byteorder != 'little':
+                offsets.byteswap()
+            blob = payload[(self.rows + 1) * offsets.itemsize:]
+            return column, [blob[offsets[row]:offsets[row + 1]].decode('utf-8') for row in range(self.rows)]
+
+        return column, json.loads(payload)
+
+    def read_array(self, name: str) -> array:
+        column, data = self.read_raw(name)
+        if not isinstance(data, array):
+            raise TypeError(f"Column {name} is {column['type']}, not a numeric array")
+        return data
+
+    def read_extras(self, name: str) -> Dict[str, Any]:
+        column = self.columns[name]
+        if 'extras' not in column:
+            return {'missing': [], 'exceptions': {}, 'ints': []}
+        with open(os.path.join(self.version_directory, column['extras']), 'rb') as f:
+            return json.loads(gzip.decompress(f.read()))
+
+    def read_layouts(self) -> Tuple[List[List[str]], List[int]]:
+        with open(os.path.join(self.version_directory, self.manifest['layouts']), 'rb') as f:
+            layouts = json.loads(gzip.decompress(f.read()))
+        return layouts['layouts'], layouts['rows']
+
+    def read_column(self, name: str) -> List[Any]:
+        _, data = self.read_raw(name)
+        extras = self.read_extras(name)
+        values = list(data)
+        for row in extras['ints']:
+            values[row] = int(values[row])
+        for row, value in extras['exceptions'].items():
+            values[int(row)] = value
+        for row in extras['missing']:
+            values[row] = None
+        return values
+
+    def read_records(self, names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        names = names or self.column_names
+        columns = {name: self.read_column(name) for name in names}
+        layouts, row_layouts = self.read_layouts()
+        return [{name: columns[name][row] for name in layouts[row_layouts[row]] if name in columns}
+                for row in range(self.rows)]
+
+
+def iter_ndjson_gz(filename: str):
+    with gzip.open(filename, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export OSRS datasets as NDJSON.gz and compressed columns')
+    parser.add_argument('--data-dir', default='data', help='Directory holding the generated JSON (default: data)')
+    parser.add_argument('--datasets', nargs='*', default=None,
+                        help=f"Datasets to export (default: {' '.join(OSRSArtifactExporter.DATASETS)})")
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Compare load times of JSON, NDJSON.gz and a single column')
+
+    args = parser.parse_args()
+
+    exporter = OSRSArtifactExporter(args.data_dir)
+    summary = exporter.export_all(args.datasets)
+
+    if not summary:
+        print("No data exported")
+        return
+
+    print("\n--- Summary ---")
+    for name, sizes in summary.items():
+        print(f"{name}: json {sizes['json'] / 1024:.0f} KiB, "
+              f"ndjson.gz {sizes['ndjson_gz'] / 1024:.0f} KiB, "
+              f"columns {sizes['columns'] / 1024:.0f} KiB")
+
+    if args.benchmark:
+        print("\n--- Load times ---")
+        for name in summary:
+            start = time.perf_counter()
+            with open(os.path.join(args.data_dir, f"{name}.json"), 'r', encoding='utf-8') as f:
+                json.load(f)
+            json_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            sum(1 for _ in iter_ndjson_gz(os.path.join(args.data_dir, f"{name}.ndjson.gz")))
+            ndjson_time = time.perf_counter() - start
+
+            reader = OSRSColumnReader(os.path.join(args.data_dir, f"{name}.columns"))
+            column_name = next((column['name'] for column in reader.manifest['columns']
+                                if column['type'] in OSRSArtifactExporter.ARRAY_TYPECODES),
+                               reader.column_names[0])
+            start = time.perf_counter()
+            OSRSColumnReader(reader.directory).read_column(column_name)
+            column_time = time.perf_counter() - start
+
+            print(f"{name}: json {json_time * 1000:.1f}ms, ndjson.gz {ndjson_time * 1000:.1f}ms, "
+                  f"column '{column_name}' {column_time * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
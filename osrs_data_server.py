@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs, unquote
+
+
+class OSRSDatasetIndex:
+    ID_FIELD = None
+    NAME_FIELD = None
+    PLACEHOLDER_IDS = {'unknown', 'removed'}
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+        with open(filename, 'rb') as f:
+            raw = f.read()
+
+        self.records: List[Dict[str, Any]] = json.loads(raw)
+        if not isinstance(self.records, list) or not all(isinstance(record, dict) for record in self.records):
+            raise ValueError(f"{filename}: expected a list of records")
+        self.version = hashlib.sha1(raw).hexdigest()[:16]
+        self.encoded = [json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+                        for record in self.records]
+
+        self.by_id: Dict[str, List[int]] = defaultdict(list)
+        self.by_name: Dict[str, List[int]] = defaultdict(list)
+        self.members: List[int] = []
+        self.free: List[int] = []
+
+        for position, record in enumerate(self.records):
+            ids = record.get(self.ID_FIELD)
+            if ids is None:
+                ids = []
+            elif not isinstance(ids, list):
+                ids = [ids]
+            for record_id in ids:
+                if str(record_id) not in self.PLACEHOLDER_IDS:
+                    self.by_id[str(record_id)].append(position)
+
+            name = record.get(self.NAME_FIELD)
+            if isinstance(name, str):
+                self.by_name[name.lower()].append(position)
+
+            if record.get('is_members_only') is True:
+                self.members.append(position)
+            else:
+                self.free.append(position)
+
+        self.by_id = dict(self.by_id)
+        self.by_name = dict(self.by_name)
+        self.members_set = set(self.members)
+        self.free_set = set(self.free)
+
+    def lookup_id(self, record_id: str) -> List[int]:
+        return self.by_id.get(record_id, [])
+
+    def lookup_name(self, name: str) -> List[int]:
+        return self.by_name.get(name.lower(), [])
+
+    def filter_members(self, positions: Optional[List[int]], members: bool) -> List[int]:
+        if positions is None:
+            return self.members if members else self.free
+        wanted = self.members_set if members else self.free_set
+        return [position for position in positions if position in wanted]
+
+    def render(self, positions: List[int], total: Optional[int] = None) -> bytes:
+        if total is None:
+            total = len(positions)
+        return b''.join([
+            b'{"total":', str(total).encode('ascii'),
+            b',"count":', str(len(positions)).encode('ascii'),
+            b',"results":[', b','.join(self.encoded[position] for position in positions), b']}',
+        ])
+
+
+class OSRSNpcIndex(OSRSDatasetIndex):
+    ID_FIELD = 'id'
+    NAME_FIELD = 'name'
+
+    def __init__(self, filename: str = "data/osrs_npcs.json"):
+        super().__init__(filename)
+
+        ranked = sorted((record['combat_level'], position)
+                        for position, record in enumerate(self.records)
+                        if isinstance(record.get('combat_level'), int))
+        self.combat_levels = [level for level, _ in ranked]
+        self.combat_positions = [position for _, position in ranked]
+        self.combat_by_position = {position: level for level, position in ranked}
+
+    def filter_combat(self, positions: Optional[List[int]], min_level: Optional[int],
+                      max_level: Optional[int]) -> List[int]:
+        if positions is not None:
+            low = float('-inf') if min_level is None else min_level
+            high = float('inf') if max_level is None else max_level
+            levels = self.combat_by_position
+            return [position for position in positions
+                    if position in levels and low <= levels[position] <= high]
+
+        start = 0 if min_level is None else bisect.bisect_left(self.combat_levels, min_level)
+        end = len(self.combat_levels) if max_level is None else bisect.bisect_right(self.combat_levels, max_level)
+        return sorted(self.combat_positions[start:end])
+
+
+class OSRSEquipmentIndex(OSRSDatasetIndex):
+    ID_FIELD = 'item_id'
+    NAME_FIELD = 'item_name'
+
+    def __init__(self, filename: str = "data/osrs_equipment_flat.json"):
+        super().__init__(filename)
+
+        self.by_slot: Dict[str, List[int]] = defaultdict(list)
+        for position, record in enumerate(self.records):
+            slot = record.get('equipment_slot')
+            if isinstance(slot, str):
+                self.by_slot[slot.lower()].append(position)
+        self.by_slot = dict(self.by_slot)
+        self.by_slot_set = {slot: set(positions) for slot, positions in self.by_slot.items()}
+
+    def filter_slot(self, positions: Optional[List[int]], slot: str) -> List[int]:
+        slot = slot.lower()
+        if positions is None:
+            return self.by_slot.get(slot, [])
+        wanted = self.by_slot_set.get(slot, set())
+        return [position for position in positions if position in wanted]
+
+
+class QueryError(Exception):
+    pass
+
+
+class OSRSDataSnapshot:
+    CACHE_MAX_BYTES = 64 * 1024 * 1024
+    CACHE_MAX_ENTRY_BYTES = 256 * 1024
+    DEFAULT_LIMIT = 100
+    MAX_LIMIT = 1000
+
+    def __init__(self, npcs: OSRSNpcIndex, equipment: OSRSEquipmentIndex):
+        self.npcs = npcs
+        self.equipment = equipment
+        self.version = f"{npcs.version}-{equipment.version}"
+        self.health = json.dumps({
+            'status': 'ok',
+            'npcs': {'version': npcs.version, 'count': len(npcs.records)},
+            'equipment': {'version': equipment.version, 'count': len(equipment.records)},
+        }).encode('utf-8')
+        self.cache: 'OrderedDict[str, Tuple[int, bytes, str]]' = OrderedDict()
+        self.cache_bytes = 0
+        self.cache_lock = threading.Lock()
+
+    def etag(self, target: str) -> str:
+        return f'"{self.version}-{zlib.crc32(target.encode("utf-8")):08x}"'
+
+    def respond(self, target: str) -> Tuple[int, bytes, str]:
+        with self.cache_lock:
+            cached = self.cache.get(target)
+            if cached is not None:
+                self.cache.move_to_end(target)
+                return cached
+
+        try:
+            status, body = self.route(target)
+        except QueryError as e:
+            status, body = 400, json.dumps({'error': str(e)}).encode('utf-8')
+
+        response = (status, body, self.etag(target))
+        if status == 200 and len(body) <= self.CACHE_MAX_ENTRY_BYTES:
+            self.cache_response(target, response)
+        return response
+
+    def clear_cache(self):
+        with self.cache_lock:
+            self.cache.clear()
+            self.cache_bytes = 0
+
+    def cache_response(self, target: str, response: Tuple[int, bytes, str]):
+        size = len(target) + len(response[1])
+        with self.cache_lock:
+            if target in self.cache:
+                return
+            self.cache[target] = response
+            self.cache_bytes += size
+            while self.cache_bytes > self.CACHE_MAX_BYTES:
+                evicted_target, evicted = self.cache.popitem(last=False)
+                self.cache_bytes -= len(evicted_target) + len(evicted[1])
+
+    def route(self, target: str) -> Tuple[int, bytes]:
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.split('/') if part]
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if parts == ['health']:
+            return 200, self.health
+
+        if not parts or parts[0] not in ('npcs', 'equipment'):
+            return 404, b'{"error":"not found"}'
+
+        index = self.npcs if parts[0] == 'npcs' else self.equipment
+
+        if len(parts) == 2:
+            positions = index.lookup_id(parts[1])
+            if not positions:
+                return 404, b'{"error":"not found"}'
+            return 200, index.render(positions)
+
+        if len(parts) > 2:
+            return 404, b'{"error":"not found"}'
+
+        return 200, self.query(index, params)
+
+    def query(self, index: OSRSDatasetIndex, params: Dict[str, str]) -> bytes:
+        positions = None
+
+        if 'name' in params:
+            positions = index.lookup_name(params['name'])
+
+        if 'slot' in params:
+            if not isinstance(index, OSRSEquipmentIndex):
+                raise QueryError("slot filter is only supported for equipment")
+            positions = index.filter_slot(positions, params['slot'])
+
+        if 'min_combat' in params or 'max_combat' in params:
+            if not isinstance(index, OSRSNpcIndex):
+                raise QueryError("combat level filters are only supported for npcs")
+            positions = index.filter_combat(positions, self.parse_int(params, 'min_combat'),
+                                            self.parse_int(params, 'max_combat'))
+
+        if 'members' in params:
+            value = params['members'].lower()
+            if value not in ('true', 'false'):
+                raise QueryError("members must be true or false")
+            positions = index.filter_members(positions, value == 'true')
+
+        if positions is None:
+            positions = range(len(index.records))
+
+        limit = self.parse_int(params, 'limit')
+        limit = self.DEFAULT_LIMIT if limit is None else max(0, min(limit, self.MAX_LIMIT))
+        offset = self.parse_int(params, 'offset') or 0
+        offset = max(0, offset)
+
+        return index.render(list(positions[offset:offset + limit]), total=len(positions))
+
+    @staticmethod
+    def parse_int(params: Dict[str, str], key: str) -> Optional[int]:
+        if key not in params:
+            return None
+        try:
+            return int(params[key])
+        except ValueError:
+            raise QueryError(f"{key} must be an integer")
+
+
+class OSRSDataStore:
+
+    def __init__(self, npc_filename: str = "data/osrs_npcs.json",
+                 equipment_filename: str = "data/osrs_equipment_flat.json",
+                 poll_interval: float = 2.0):
+        self.npc_filename = npc_filename
+        self.equipment_filename = equipment_filename
+        self.poll_interval = poll_interval
+        self.stamp = self.file_stamp()
+        self.snapshot = self.load()
+        self._stop = threading.Event()
+        self._watcher = None
+
+    def file_stamp(self) -> Tuple:
+        stamp = []
+        for filename in (self.npc_filename, self.equipment_filename):
+            stat = os.stat(filename)
+            stamp.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        return tuple(stamp)
+
+    def load(self) -> OSRSDataSnapshot:
+        return OSRSDataSnapshot(OSRSNpcIndex(self.npc_filename),
+                                OSRSEquipmentIndex(self.equipment_filename))
+
+    def reload_if_changed(self) -> bool:
+        try:
+            stamp = self.file_stamp()
+        except OSError as e:
+            print(f"Reload skipped: {e}")
+            return False
+
+        if stamp == self.stamp:
+            return False
+
+        self.stamp = stamp
+        try:
+            snapshot = self.load()
+        except (OSError, ValueError) as e:
+            print(f"Reload failed, keeping version {self.snapshot.version}: {e}")
+            return False
+
+        self.snapshot = snapshot
+        print(f"Reloaded data, version {snapshot.version}")
+        return True
+
+    def start_watching(self):
+        if self._watcher is not None or self.poll_interval <= 0:
+            return
+        self._watcher = threading.Thread(target=self._watch, name='osrs-data-watcher', daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.reload_if_changed()
+            except Exception as e:
+                print(f"Reload failed, keeping version {self.snapshot.version}: {e!r}")
+
+
+class OSRSDataRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'OSRSDataServer/1.0'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.handle_query(send_body=True)
+
+    def do_HEAD(self):
+        self.handle_query(send_body=False)
+
+    def handle_query(self, send_body: bool):
+        snapshot = self.server.store.snapshot
+        status, body, etag = snapshot.respond(self.path)
+
+        if status == 200 and self.etag_matches(etag):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if status == 200:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def etag_matches(self, etag: str) -> bool:
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return False
+        for tag in header.split(','):
+            tag = tag.strip()
+            if tag == '*':
+                return True
+            if tag.startswith('W/'):
+                tag = tag[2:]
+            if tag == etag:
+                return True
+        return False
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class OSRSDataServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: Tuple[str, int], store: OSRSDataStore, verbose: bool = False):
+        self.store = store
+        self.verbose = verbose
+        super().__init__(address, OSRSDataRequestHandler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve generated OSRS data over a read-only HTTP API')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    parser.add_argument('--npcs', default='data/osrs_npcs.json',
+                        help='NPC dataset (default: data/osrs_npcs.json)')
+    parser.add_argument('--equipment', default='data/osrs_equipment_flat.json',
+                        help='Equipment dataset (default: data/osrs_equipment_flat.json)')
+    parser.add_argument('--poll-interval', type=float, default=2.0,
+                        help='Seconds between checks for new data, 0 disables reloading (default: 2)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+
+    args = parser.parse_args()
+
+    store = OSRSDataStore(args.npcs, args.equipment, args.poll_interval)
+    snapshot = store.snapshot
+    print(f"Loaded {len(snapshot.npcs.records)} NPCs and {len(snapshot.equipment.records)} equipment items")
+
+    store.start_watching()
+    server = OSRSDataServer((args.host, args.port), store, verbose=args.verbose)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down")
+    finally:
+        server.server_close()
+        store.stop_watching()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+import argparse
+import http.client
+import multiprocessing
+import random
+import statistics
+import threading
+import time
+from typing import List, Dict, Any
+from urllib.parse import quote, urlsplit
+
+from osrs_data_server import OSRSDataServer, OSRSDataStore
+
+
+def build_targets(store: OSRSDataStore, count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    snapshot = store.snapshot
+    npc_ids = list(snapshot.npcs.by_id)
+    item_ids = list(snapshot.equipment.by_id)
+    npc_names = [record['name'] for record in snapshot.npcs.records]
+    slots = list(snapshot.equipment.by_slot)
+
+    targets = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.35:
+            targets.append(f"/npcs/{quote(rng.choice(npc_ids))}")
+        elif kind < 0.7:
+            targets.append(f"/equipment/{quote(rng.choice(item_ids))}")
+        elif kind < 0.8:
+            targets.append(f"/npcs?name={quote(rng.choice(npc_names))}")
+        elif kind < 0.9:
+            low = rng.randint(1, 300)
+            targets.append(f"/npcs?min_combat={low}&max_combat={low + 10}&members=true&limit=20")
+        else:
+            targets.append(f"/equipment?slot={rng.choice(slots)}&members=false&limit=20")
+    return targets
+
+
+def run_client(host: str, port: int, targets: List[str], duration: float, conditional: bool, results):
+    connection = http.client.HTTPConnection(host, port)
+    etags: Dict[str, str] = {}
+    latencies = []
+    errors = 0
+    position = 0
+    deadline = time.perf_counter() + duration
+
+    while time.perf_counter() < deadline:
+        target = targets[position % len(targets)]
+        position += 1
+        headers = {}
+        if conditional and target in etags:
+            headers['If-None-Match'] = etags[target]
+
+        start = time.perf_counter()
+        try:
+            connection.request('GET', target, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            connection = http.client.HTTPConnection(host, port)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+        if response.status >= 500:
+            errors += 1
+        etag = response.getheader('ETag')
+        if etag:
+            etags[target] = etag
+
+    connection.close()
+    results.put((latencies, errors))
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def report(label: str, latencies: List[float], errors: int, elapsed: float):
+    latencies.sort()
+    print(f"{label}:")
+    print(f"  requests: {len(latencies)}  errors: {errors}  throughput: {len(latencies) / elapsed:.0f} req/s")
+    if latencies:
+        print(f"  mean: {statistics.mean(latencies) * 1e6:.0f}us"
+              f"  p50: {percentile(latencies, 0.50) * 1e6:.0f}us"
+              f"  p95: {percentile(latencies, 0.95) * 1e6:.0f}us"
+              f"  p99: {percentile(latencies, 0.99) * 1e6:.0f}us"
+              f"  max: {latencies[-1] * 1e6:.0f}us")
+
+
+def benchmark_index(store: OSRSDataStore, targets: List[str]):
+    snapshot = store.snapshot
+    latencies = []
+    for target in targets:
+        snapshot.clear_cache()
+        start = time.perf_counter()
+        snapshot.respond(target)
+        latencies.append(time.perf_counter() - start)
+    report("In-process lookups (uncached)", latencies, 0, sum(latencies))
+
+
+def benchmark_http(host: str, port: int, targets: List[str], clients: int, duration: float, conditional: bool):
+    results = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=run_client,
+                                       args=(host, port, targets[i::clients] or targets, duration, conditional,
+                                             results))
+               for i in range(clients)]
+
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+
+    latencies: List[float] = []
+    errors = 0
+    for _ in workers:
+        worker_latencies, worker_errors = results.get()
+        latencies.extend(worker_latencies)
+        errors += worker_errors
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    label = "HTTP lookups with If-None-Match" if conditional else "HTTP lookups"
+    report(f"{label} ({clients} clients, {duration:g}s)", latencies, errors, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure lookup latency of the OSRS data server')
+    parser.add_argument('--url', default=None,
+                        help='Benchmark an already running server (default: start one in-process)')
+    parser.add_argument('--clients', type=int, default=8, help='Concurrent client processes (default: 8)')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds per HTTP run (default: 5)')
+    parser.add_argument('--requests', type=int, default=5000, help='Distinct request targets (default: 5000)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for request targets (default: 1)')
+
+    args = parser.parse_args()
+
+    store = OSRSDataStore(poll_interval=0)
+    targets = build_targets(store, args.requests, args.seed)
+
+    benchmark_index(store, targets)
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        server = OSRSDataServer(('127.0.0.1', 0), store)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address[:2]
+
+    try:
+        benchmark_http(host, port, targets, args.clients, args.duration, conditional=False)
+        benchmark_http(host, port, targets, args.clients, args.duration, conditional=True)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()